@@ -3,6 +3,8 @@ Configuration objects for language servers
 """
 
 import fnmatch
+import os
+import re
 from collections.abc import Iterable
 from dataclasses import dataclass, field
 from enum import Enum
@@ -18,12 +20,16 @@ class FilenameMatcher:
         :param patterns: fnmatch-compatible patterns
         """
         self.patterns = patterns
+        # combine all patterns into a single regex (with fnmatch.fnmatch's case normalisation),
+        # such that matching a filename requires only one regex evaluation
+        self._regex: re.Pattern[str] | None = (
+            re.compile("|".join(fnmatch.translate(os.path.normcase(pattern)) for pattern in patterns)) if patterns else None
+        )
 
     def is_relevant_filename(self, fn: str) -> bool:
-        for pattern in self.patterns:
-            if fnmatch.fnmatch(fn, pattern):
-                return True
-        return False
+        if self._regex is None:
+            return False
+        return self._regex.match(os.path.normcase(fn)) is not None
 
 
 class Language(str, Enum):